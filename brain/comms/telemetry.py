@@ -0,0 +1,301 @@
+import json
+import socket
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Protocol, Tuple
+
+
+# capture_ts and send_ts are both seconds on the brain's time.monotonic() clock, the same clock
+# MultiLimelightPose.step() stamps with. The robot must not compare them against its own clock:
+# send_ts - capture_ts is the pipeline age at send time, and the gap between consecutive send_ts
+# values (or a jump in seq) tells it an update is stale or was dropped.
+RECORD_VERSION = 1
+
+FLAG_POSE_VALID = 0x01
+FLAG_OCCLUSION = 0x02
+
+# version, flags, seq, capture_ts, send_ts, x_m, y_m, rot_deg, velocity_scale
+RECORD_STRUCT = struct.Struct("<BBIddffff")
+# seq, send_ts echoed back by the robot
+ACK_STRUCT = struct.Struct("<Id")
+
+
+@dataclass
+class TelemetryRecord:
+    seq: int
+    capture_ts: float
+    send_ts: float
+    pose: Optional[Tuple[float, float, float]]
+    velocity_scale: float
+    occlusion: bool
+
+    def flags(self) -> int:
+        flags = 0
+        if self.pose is not None:
+            flags |= FLAG_POSE_VALID
+        if self.occlusion:
+            flags |= FLAG_OCCLUSION
+        return flags
+
+    def pack(self) -> bytes:
+        x_m, y_m, rot_deg = self.pose if self.pose is not None else (0.0, 0.0, 0.0)
+        return RECORD_STRUCT.pack(
+            RECORD_VERSION,
+            self.flags(),
+            self.seq & 0xFFFFFFFF,
+            self.capture_ts,
+            self.send_ts,
+            x_m,
+            y_m,
+            rot_deg,
+            self.velocity_scale,
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "TelemetryRecord":
+        version, flags, seq, capture_ts, send_ts, x_m, y_m, rot_deg, velocity_scale = RECORD_STRUCT.unpack(
+            data[: RECORD_STRUCT.size]
+        )
+        if version != RECORD_VERSION:
+            raise ValueError(f"unsupported telemetry record version {version}")
+        pose = (x_m, y_m, rot_deg) if flags & FLAG_POSE_VALID else None
+        return cls(
+            seq=seq,
+            capture_ts=capture_ts,
+            send_ts=send_ts,
+            pose=pose,
+            velocity_scale=velocity_scale,
+            occlusion=bool(flags & FLAG_OCCLUSION),
+        )
+
+
+@dataclass
+class TelemetryConfig:
+    transport: str = "udp"
+    table: str = "phadbrain"
+    host: str = "10.4.18.2"
+    port: int = 5810
+    # 0 disables acks; otherwise the UDP socket binds ack_bind_host:ack_port to receive them.
+    ack_port: int = 0
+    ack_bind_host: str = ""
+    max_rate_hz: float = 100.0
+    keepalive_s: float = 0.1
+
+
+class TelemetryTransport(Protocol):
+    error_count: int
+
+    def send(self, payload: bytes) -> None:
+        ...
+
+    def poll_ack(self) -> Optional[Tuple[int, float]]:
+        ...
+
+
+class NetworkTablesRawInterface(Protocol):
+    def put_raw(self, key: str, value: bytes) -> None:
+        ...
+
+    def get_double_array(self, key: str, default: List[float]) -> List[float]:
+        ...
+
+
+class NetworkTablesTransport:
+    def __init__(self, nt_client: NetworkTablesRawInterface, table: str = "phadbrain") -> None:
+        self.nt_client = nt_client
+        self.record_key = f"{table}/telemetry"
+        self.ack_key = f"{table}/telemetry_ack"
+        self.last_ack_seq: Optional[int] = None
+        self.error_count = 0
+
+    def send(self, payload: bytes) -> None:
+        self.nt_client.put_raw(self.record_key, payload)
+
+    def poll_ack(self) -> Optional[Tuple[int, float]]:
+        data = self.nt_client.get_double_array(self.ack_key, [])
+        if len(data) < 2:
+            return None
+        seq = int(data[0])
+        if seq == self.last_ack_seq:
+            return None
+        self.last_ack_seq = seq
+        return seq, float(data[1])
+
+
+class UdpTransport:
+    def __init__(self, host: str, port: int, ack_port: int = 0, ack_bind_host: str = "") -> None:
+        self.address = (host, port)
+        self.robot_host = socket.gethostbyname(host)
+        self.acks_enabled = ack_port > 0
+        self.error_count = 0
+        self.last_error: Optional[OSError] = None
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        if self.acks_enabled:
+            self.sock.bind((ack_bind_host, ack_port))
+
+    def _record_error(self, err: OSError) -> None:
+        self.error_count += 1
+        self.last_error = err
+
+    def send(self, payload: bytes) -> None:
+        try:
+            self.sock.sendto(payload, self.address)
+        except (BlockingIOError, InterruptedError):
+            # A full send buffer drops this record rather than stalling the pipeline; the robot sees the seq gap.
+            pass
+        except OSError as err:
+            self._record_error(err)
+
+    def poll_ack(self) -> Optional[Tuple[int, float]]:
+        if not self.acks_enabled:
+            return None
+        latest: Optional[Tuple[int, float]] = None
+        while True:
+            try:
+                data, (src_host, _) = self.sock.recvfrom(64)
+            except (BlockingIOError, InterruptedError):
+                return latest
+            except OSError as err:
+                self._record_error(err)
+                return latest
+            if src_host != self.robot_host or len(data) < ACK_STRUCT.size:
+                continue
+            latest = ACK_STRUCT.unpack(data[: ACK_STRUCT.size])
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class TelemetryPublisher:
+    def __init__(
+        self,
+        transport: TelemetryTransport,
+        config: Optional[TelemetryConfig] = None,
+        clock=time.monotonic,
+    ) -> None:
+        self.transport = transport
+        self.config = config or TelemetryConfig()
+        self.clock = clock
+        self.min_period = 1.0 / self.config.max_rate_hz if self.config.max_rate_hz > 0 else 0.0
+        self.seq = 0
+        self.last_send: Optional[float] = None
+        self.last_payload: Optional[bytes] = None
+        self.sent_count = 0
+        self.skipped_count = 0
+        self.last_rtt_s: Optional[float] = None
+        self.rtt_ema_s: Optional[float] = None
+
+    @staticmethod
+    def _content_key(
+        pose: Optional[Tuple[float, float, float]], velocity_scale: float, occlusion: bool
+    ) -> bytes:
+        packed = TelemetryRecord(0, 0.0, 0.0, pose, velocity_scale, occlusion).pack()
+        # Compare at wire precision so float noise below float32 does not count as a change.
+        return packed[:2] + packed[-16:]
+
+    def publish(
+        self,
+        pose: Optional[Tuple[float, float, float]],
+        velocity_scale: float,
+        occlusion: bool,
+        capture_ts: float,
+    ) -> bool:
+        self.poll()
+        now = self.clock()
+        if self.last_send is not None and now - self.last_send < self.min_period:
+            self.skipped_count += 1
+            return False
+        content = self._content_key(pose, velocity_scale, occlusion)
+        if (
+            content == self.last_payload
+            and self.last_send is not None
+            and now - self.last_send < self.config.keepalive_s
+        ):
+            self.skipped_count += 1
+            return False
+        self.seq = (self.seq + 1) & 0xFFFFFFFF
+        record = TelemetryRecord(self.seq, capture_ts, now, pose, velocity_scale, occlusion)
+        self.transport.send(record.pack())
+        self.last_send = now
+        self.last_payload = content
+        self.sent_count += 1
+        self.poll()
+        return True
+
+    def publish_step(self, result: Dict[str, object]) -> bool:
+        pose = result.get("final_pose")
+        return self.publish(
+            pose=tuple(pose) if pose is not None else None,
+            velocity_scale=float(result.get("final_velocity_scale", 0.0)),
+            occlusion=bool(result.get("occlusion", False)),
+            capture_ts=float(result.get("capture_ts", self.clock())),
+        )
+
+    def poll(self) -> None:
+        # RTT is taken when the ack is polled, not when it arrived, so it is an upper bound that
+        # includes however long the ack waited. Call poll() on a short timer between steps to
+        # keep that slack well below the loop period.
+        ack = self.transport.poll_ack()
+        if ack is None:
+            return
+        _, echoed_send_ts = ack
+        rtt = self.clock() - echoed_send_ts
+        if rtt < 0:
+            return
+        self.last_rtt_s = rtt
+        self.rtt_ema_s = rtt if self.rtt_ema_s is None else 0.9 * self.rtt_ema_s + 0.1 * rtt
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "seq": self.seq,
+            "sent": self.sent_count,
+            "skipped": self.skipped_count,
+            "last_rtt_s": self.last_rtt_s,
+            "rtt_ema_s": self.rtt_ema_s,
+            "transport_errors": self.transport.error_count,
+        }
+
+
+def load_telemetry_config() -> TelemetryConfig:
+    root = Path(__file__).resolve().parent.parent.parent
+    cfg_path = root / "constants.json"
+    cfg: Dict = {}
+    if cfg_path.exists():
+        try:
+            with cfg_path.open("r", encoding="utf-8") as f:
+                cfg = json.load(f)
+        except Exception:
+            cfg = {}
+    tel = cfg.get("telemetry", {})
+    defaults = TelemetryConfig()
+    return TelemetryConfig(
+        transport=str(tel.get("transport", defaults.transport)),
+        table=str(tel.get("table", defaults.table)),
+        host=str(tel.get("host", defaults.host)),
+        port=int(tel.get("port", defaults.port)),
+        ack_port=int(tel.get("ack_port", defaults.ack_port)),
+        ack_bind_host=str(tel.get("ack_bind_host", defaults.ack_bind_host)),
+        max_rate_hz=float(tel.get("max_rate_hz", defaults.max_rate_hz)),
+        keepalive_s=float(tel.get("keepalive_s", defaults.keepalive_s)),
+    )
+
+
+def build_publisher(
+    nt_client: Optional[NetworkTablesRawInterface] = None,
+    config: Optional[TelemetryConfig] = None,
+) -> TelemetryPublisher:
+    config = config or load_telemetry_config()
+    if config.transport == "udp":
+        transport: TelemetryTransport = UdpTransport(
+            config.host, config.port, config.ack_port, config.ack_bind_host
+        )
+    elif config.transport == "nt":
+        if nt_client is None:
+            raise ValueError("nt telemetry transport requires an nt_client")
+        transport = NetworkTablesTransport(nt_client, config.table)
+    else:
+        raise ValueError(f"unknown telemetry transport {config.transport!r}")
+    return TelemetryPublisher(transport, config)
@@ -77,6 +77,7 @@ class MultiLimelightPose:
         self.last_tx: Dict[str, Optional[float]] = {cam.name: None for cam in self.cameras}
         self.last_corners: Dict[str, Optional[List[float]]] = {cam.name: None for cam in self.cameras}
         self.last_tag: Dict[str, int] = {cam.name: -1 for cam in self.cameras}
+        self.last_capture: Dict[str, float] = {cam.name: 0.0 for cam in self.cameras}
         self.dropout_speed_scale = float(cfg.get("limelight", {}).get("dropout_speed_scale", 0.6))
         self.occlusion_window = float(cfg.get("limelight", {}).get("occlusion_window", 0.15))
 
@@ -119,19 +120,26 @@ class MultiLimelightPose:
             )
         return cams
 
-    def _parse_botpose(self, cam: CameraConfig, suffix: str) -> Optional[Pose2d]:
+    def _parse_botpose(self, cam: CameraConfig, suffix: str) -> Optional[Tuple[Pose2d, Optional[float]]]:
         data = self.nt_client.get_double_array(self._entry_key(cam, suffix), [])
         if len(data) < 6:
             return None
         x_m, y_m, yaw_deg = data[0], data[1], data[5]
-        return Pose2d(Translation2d(x_m, y_m), Rotation2d.from_degrees(yaw_deg))
+        latency_ms = data[6] if len(data) >= 7 else None
+        return Pose2d(Translation2d(x_m, y_m), Rotation2d.from_degrees(yaw_deg)), latency_ms
 
-    def _limelight_pose(self, cam: CameraConfig) -> Optional[Pose2d]:
+    def _limelight_pose(self, cam: CameraConfig) -> Tuple[Optional[Pose2d], Optional[float]]:
         for suffix in ("botpose", "botpose_wpiblue", "botpose_wpired"):
-            pose = self._parse_botpose(cam, suffix)
-            if pose:
-                return pose
-        return None
+            parsed = self._parse_botpose(cam, suffix)
+            if parsed:
+                return parsed
+        return None, None
+
+    def _latency_ms(self, cam: CameraConfig) -> float:
+        # tl is pipeline latency, cl is image capture latency; together they match botpose[6].
+        tl = self.nt_client.get_double(self._entry_key(cam, "tl"), 0.0)
+        cl = self.nt_client.get_double(self._entry_key(cam, "cl"), 0.0)
+        return tl + cl
 
     def _parse_targetpose_robotspace(self, cam: CameraConfig) -> Optional[float]:
         data = self.nt_client.get_double_array(self._entry_key(cam, "targetpose_robotspace"), [])
@@ -279,8 +287,11 @@ class MultiLimelightPose:
         status = "ok" if has_measurement else "lost"
         velocity_scale = 1.0
 
+        limelight_pose, botpose_latency_ms = self._limelight_pose(cam)
         if has_measurement:
+            latency_ms = botpose_latency_ms if botpose_latency_ms is not None else self._latency_ms(cam)
             self.last_seen[cam.name] = now
+            self.last_capture[cam.name] = now - latency_ms / 1000.0
             self.last_corners[cam.name] = list(corners)
             self.last_tx[cam.name] = tx
             self.last_tag[cam.name] = tag_id
@@ -309,7 +320,6 @@ class MultiLimelightPose:
             if abs(denom) > 1e-6:
                 megatag2_distance_feet = ((tag_height_in - cam.height_inches) / 12.0) / denom
 
-        limelight_pose = self._limelight_pose(cam)
         manual_pose = self._manual_pose(cam, tx, corners, tag_id)
         pose = limelight_pose or manual_pose
         if has_measurement and pose:
@@ -325,6 +335,7 @@ class MultiLimelightPose:
             "aligned": aligned,
             "status": status,
             "velocity_scale": velocity_scale,
+            "capture_ts": self.last_capture[cam.name],
             **movement,
         }
         if target_distance_m is not None:
@@ -379,13 +390,14 @@ class MultiLimelightPose:
         return result
 
     def step(self) -> Dict[str, object]:
-        now = time.time()
+        now = time.monotonic()
         per_cam: List[Dict[str, float]] = []
         poses_x: List[float] = []
         poses_y: List[float] = []
         poses_rot: List[float] = []
         distances_m: List[float] = []
         megatag2_distances_m: List[float] = []
+        capture_times: List[float] = []
         velocity_scale = 1.0
         for cam in self.cameras:
             res = self._camera_step(cam, now)
@@ -394,6 +406,7 @@ class MultiLimelightPose:
                 poses_x.append(res["pose_x_m"])
                 poses_y.append(res["pose_y_m"])
                 poses_rot.append(res["pose_rot_deg"])
+                capture_times.append(res["capture_ts"])
             if "target_distance_m" in res:
                 distances_m.append(res["target_distance_m"])
             else:
@@ -425,7 +438,12 @@ class MultiLimelightPose:
                 occlusion = True
                 velocity_scale = 0.0
 
+        # The fused pose is only as fresh as the oldest camera frame that went into it.
+        capture_ts = min(capture_times) if capture_times else now
+
         return {
+            "timestamp": now,
+            "capture_ts": capture_ts,
             "cameras": per_cam,
             "final_pose": final_pose,
             "final_distance_m": final_distance_m,
@@ -0,0 +1,186 @@
+import select
+import socket
+from typing import List, Optional, Tuple
+
+import pytest
+
+from brain.comms.telemetry import (
+    ACK_STRUCT,
+    RECORD_STRUCT,
+    TelemetryConfig,
+    TelemetryPublisher,
+    TelemetryRecord,
+    UdpTransport,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTransport:
+    def __init__(self) -> None:
+        self.sent: List[bytes] = []
+        self.acks: List[Tuple[int, float]] = []
+        self.error_count = 0
+
+    def send(self, payload: bytes) -> None:
+        self.sent.append(payload)
+
+    def poll_ack(self) -> Optional[Tuple[int, float]]:
+        return self.acks.pop(0) if self.acks else None
+
+
+def make_publisher(max_rate_hz: float = 50.0, keepalive_s: float = 0.1):
+    clock = FakeClock()
+    transport = FakeTransport()
+    config = TelemetryConfig(max_rate_hz=max_rate_hz, keepalive_s=keepalive_s)
+    return TelemetryPublisher(transport, config, clock=clock), transport, clock
+
+
+def test_record_layout_is_38_bytes():
+    assert RECORD_STRUCT.size == 38
+    record = TelemetryRecord(7, 1.5, 1.6, (1.0, 2.0, 90.0), 0.5, False)
+    assert len(record.pack()) == 38
+
+
+def test_record_round_trip():
+    record = TelemetryRecord(42, 12.25, 12.5, (1.5, -2.25, 45.0), 0.75, True)
+    decoded = TelemetryRecord.unpack(record.pack())
+    assert decoded == record
+
+
+def test_record_without_pose_round_trips_as_none():
+    record = TelemetryRecord(1, 0.0, 0.0, None, 0.0, True)
+    decoded = TelemetryRecord.unpack(record.pack())
+    assert decoded.pose is None
+    assert decoded.occlusion
+
+
+def test_unpack_rejects_unknown_version():
+    data = bytearray(TelemetryRecord(1, 0.0, 0.0, None, 0.0, False).pack())
+    data[0] = 99
+    with pytest.raises(ValueError):
+        TelemetryRecord.unpack(bytes(data))
+
+
+def test_first_publish_sends_with_capture_and_send_time():
+    publisher, transport, clock = make_publisher()
+    assert publisher.publish((1.0, 2.0, 3.0), 1.0, False, capture_ts=99.95)
+    record = TelemetryRecord.unpack(transport.sent[0])
+    assert record.seq == 1
+    assert record.capture_ts == 99.95
+    assert record.send_ts == clock.now
+
+
+def test_rate_cap_skips_sends_inside_min_period():
+    publisher, transport, clock = make_publisher(max_rate_hz=50.0)
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    clock.now += 0.01
+    assert not publisher.publish((1.0, 2.0, 4.0), 1.0, False, clock.now)
+    clock.now += 0.011
+    assert publisher.publish((1.0, 2.0, 4.0), 1.0, False, clock.now)
+    assert len(transport.sent) == 2
+
+
+def test_unchanged_content_waits_for_keepalive():
+    publisher, transport, clock = make_publisher(max_rate_hz=0.0, keepalive_s=0.1)
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    clock.now += 0.05
+    assert not publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    clock.now += 0.06
+    assert publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    assert publisher.stats()["skipped"] == 1
+
+
+def test_change_below_float32_precision_is_not_a_change():
+    publisher, transport, clock = make_publisher(max_rate_hz=0.0)
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    clock.now += 0.01
+    assert not publisher.publish((1.0 + 1e-12, 2.0, 3.0), 1.0, False, clock.now)
+
+
+def test_occlusion_flag_change_is_sent_immediately():
+    publisher, transport, clock = make_publisher(max_rate_hz=0.0)
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    clock.now += 0.01
+    assert publisher.publish((1.0, 2.0, 3.0), 0.0, True, clock.now)
+    assert TelemetryRecord.unpack(transport.sent[-1]).occlusion
+
+
+def test_seq_wraps_at_32_bits():
+    publisher, transport, clock = make_publisher(max_rate_hz=0.0)
+    publisher.seq = 0xFFFFFFFF
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    assert TelemetryRecord.unpack(transport.sent[-1]).seq == 0
+
+
+def test_publish_step_uses_fused_capture_ts():
+    publisher, transport, clock = make_publisher()
+    result = {
+        "timestamp": clock.now,
+        "capture_ts": clock.now - 0.04,
+        "final_pose": (1.0, 2.0, 3.0),
+        "final_velocity_scale": 0.6,
+        "occlusion": False,
+    }
+    publisher.publish_step(result)
+    record = TelemetryRecord.unpack(transport.sent[0])
+    assert record.send_ts - record.capture_ts == pytest.approx(0.04)
+    assert record.velocity_scale == pytest.approx(0.6)
+
+
+def test_ack_measures_rtt_from_echoed_send_ts():
+    publisher, transport, clock = make_publisher()
+    publisher.publish((1.0, 2.0, 3.0), 1.0, False, clock.now)
+    sent_at = clock.now
+    clock.now += 0.008
+    transport.acks.append((1, sent_at))
+    publisher.poll()
+    assert publisher.stats()["last_rtt_s"] == pytest.approx(0.008)
+
+
+def _ack_round(robot_host: str) -> Optional[Tuple[int, float]]:
+    transport = UdpTransport(robot_host, 9, ack_port=_free_port(), ack_bind_host="127.0.0.1")
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.bind(("127.0.0.1", 0))
+    sender.sendto(ACK_STRUCT.pack(1, 5.0), transport.sock.getsockname())
+    select.select([transport.sock], [], [], 1.0)
+    ack = transport.poll_ack()
+    transport.close()
+    sender.close()
+    return ack
+
+
+def _free_port() -> int:
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def test_udp_transport_without_ack_port_does_not_bind():
+    transport = UdpTransport("127.0.0.1", 9)
+    assert transport.poll_ack() is None
+    assert transport.sock.getsockname()[1] == 0
+    transport.close()
+
+
+def test_udp_transport_accepts_acks_from_robot_host():
+    assert _ack_round("127.0.0.1") == (1, 5.0)
+
+
+def test_udp_transport_drops_acks_from_other_hosts():
+    assert _ack_round("127.0.0.2") is None
+
+
+def test_udp_send_errors_are_counted():
+    transport = UdpTransport("127.0.0.1", 9)
+    transport.sock.close()
+    transport.send(b"x")
+    assert transport.error_count == 1